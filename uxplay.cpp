@@ -83,6 +83,7 @@ static int64_t audio_delay_alac = 0;
 static int64_t audio_delay_aac = 0;
 static bool relaunch_video = false;
 static bool reset_loop = false;
+static GMainLoop *running_loop = NULL;
 static unsigned int open_connections= 0;
 static std::string videosink = "autovideosink";
 static videoflip_t videoflip[2] = { NONE , NONE };
@@ -349,11 +350,17 @@ static void dump_video_to_file(unsigned char *data, int datalen) {
     }
 }
 
-static gboolean reset_callback(gpointer loop) {
-    if (reset_loop) {
-        g_main_loop_quit((GMainLoop *) loop);
+static gboolean reset_callback(gpointer data) {
+    /* queued with g_idle_add() when reset_loop is set; only dispatched inside main_loop() */
+    if (reset_loop && running_loop) {
+        g_main_loop_quit(running_loop);
     }
-    return TRUE;
+    return FALSE;
+}
+
+static void request_loop_reset() {
+    reset_loop = true;
+    g_idle_add((GSourceFunc) reset_callback, NULL);
 }
 
 static gboolean  sigint_callback(gpointer loop) {
@@ -397,7 +404,7 @@ static void main_loop()  {
         relaunch_video = true;
         gst_bus_watch_id = (guint) video_renderer_listen((void *)loop);
     }
-    guint reset_watch_id = g_timeout_add(100, (GSourceFunc) reset_callback, (gpointer) loop);
+    running_loop = loop;
     guint sigterm_watch_id = g_unix_signal_add(SIGTERM, (GSourceFunc) sigterm_callback, (gpointer) loop);
     guint sigint_watch_id = g_unix_signal_add(SIGINT, (GSourceFunc) sigint_callback, (gpointer) loop);
     g_main_loop_run(loop);
@@ -405,7 +412,7 @@ static void main_loop()  {
     if (gst_bus_watch_id > 0) g_source_remove(gst_bus_watch_id);
     if (sigint_watch_id > 0) g_source_remove(sigint_watch_id);
     if (sigterm_watch_id > 0) g_source_remove(sigterm_watch_id);
-    if (reset_watch_id > 0) g_source_remove(reset_watch_id);
+    running_loop = NULL;
     g_main_loop_unref(loop);
 }    
 
@@ -1505,12 +1512,12 @@ extern "C" void conn_reset (void *cls, int timeouts, bool reset_video) {
     printf("reset_video %d\n",(int) reset_video);
     close_window = reset_video;    /* leave "frozen" window open if reset_video is false */
     raop_stop(raop);
-    reset_loop = true;
+    request_loop_reset();
 }
 
 extern "C" void conn_teardown(void *cls, bool *teardown_96, bool *teardown_110) {
     if (*teardown_110 && close_window) {
-        reset_loop = true;
+        request_loop_reset();
     }
 }
 